@@ -10,14 +10,13 @@ import threading
 import time
 import webbrowser
 import sqlite3
-import json
 import logging
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Web framework
-from flask import Flask, render_template_string, request, jsonify, session, redirect, url_for, flash
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash
 from werkzeug.security import generate_password_hash, check_password_hash
 
 from dotenv import load_dotenv
@@ -26,6 +25,8 @@ from dotenv import load_dotenv
 from twilio.rest import Client
 from twilio.twiml.messaging_response import MessagingResponse
 
+from rhas_database import decode_symptoms, encode_symptoms
+
 # Import the advanced disease classification engine
 try:
     from advanced_disease_classifier import classify_health_message
@@ -582,7 +583,7 @@ def save_enhanced_message(phone_number, message_body, channel, symptoms_data, di
              location_city, location_state, fraud_score, points_earned, tier, severity_level,
              response_sent, lat, lon)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (phone_number, message_body, channel, json.dumps(symptom_names), disease, confidence,
+        ''', (phone_number, message_body, channel, encode_symptoms(symptom_names), disease, confidence,
               location_data.get('city', 'Unknown'), location_data.get('state', 'Unknown'), 
               fraud_score, points, tier, severity, 1 if response_sent else 0,
               location_data.get('lat', 0.0), location_data.get('lon', 0.0)))
@@ -652,7 +653,7 @@ def get_enhanced_dashboard_data(role):
                 'phone_number': row[0],
                 'message': row[1],
                 'channel': row[2],
-                'symptoms': json.loads(row[3]) if row[3] else [],
+                'symptoms': decode_symptoms(row[3]),
                 'predicted_disease': row[4],
                 'location': row[5],
                 'fraud_score': row[6],
@@ -988,7 +989,7 @@ def login():
     
     if 'user' in session:
         return redirect(url_for('dashboard'))
-    return render_template_string(ENHANCED_LOGIN_TEMPLATE)
+    return render_template(LOGIN_PAGE)
 
 
 @app.route('/dashboard', methods=['GET'])
@@ -1000,7 +1001,7 @@ def dashboard():
     name = session.get('name', 'User')
     data = get_enhanced_dashboard_data(role)
     
-    return render_template_string(ENHANCED_DASHBOARD_TEMPLATE, role=role, name=name, data=data)
+    return render_template(DASHBOARD_PAGE, role=role, name=name, data=data)
 
 @app.route('/logout')
 def logout():
@@ -1108,7 +1109,7 @@ def government_alerts_page():
     
     try:
         alert_data = get_alert_dashboard_data()
-        return render_template_string(GOVERNMENT_ALERTS_TEMPLATE, 
+        return render_template(GOVERNMENT_ALERTS_PAGE,
                                     role=session.get('role', 'User'),
                                     name=session.get('name', 'User'),
                                     alert_data=alert_data)
@@ -1127,7 +1128,7 @@ def detailed_action_status():
     try:
         # Get comprehensive alert and action data
         detailed_data = get_detailed_action_status_data()
-        return render_template_string(DETAILED_ACTION_STATUS_TEMPLATE,
+        return render_template(DETAILED_ACTION_STATUS_PAGE,
                                     role=session.get('role', 'User'),
                                     name=session.get('name', 'User'),
                                     detailed_data=detailed_data)
@@ -2814,6 +2815,12 @@ DETAILED_ACTION_STATUS_TEMPLATE = '''
 </html>
 '''
 
+# Compiled once at import; render_template_string would parse and compile these on every request
+LOGIN_PAGE = app.jinja_env.from_string(ENHANCED_LOGIN_TEMPLATE)
+DASHBOARD_PAGE = app.jinja_env.from_string(ENHANCED_DASHBOARD_TEMPLATE)
+GOVERNMENT_ALERTS_PAGE = app.jinja_env.from_string(GOVERNMENT_ALERTS_TEMPLATE)
+DETAILED_ACTION_STATUS_PAGE = app.jinja_env.from_string(DETAILED_ACTION_STATUS_TEMPLATE)
+
 # Initialize RHAS features
 rhas_features = RHASEnhancedFeatures()
 
@@ -4,11 +4,27 @@
 Provides accurate metrics, charts, and time series data based on real database content
 """
 
-import sqlite3
 from datetime import datetime, timedelta
 from collections import defaultdict
 import json
 
+from rhas_database import decode_symptoms, parse_timestamp, read_connection
+
+# Channel, severity, disease and top-location breakdowns in one pass over the maintained totals
+BREAKDOWNS_SQL = '''
+    SELECT dimension, value, cases FROM health_messages_totals WHERE dimension IN ('channel', 'severity')
+    UNION ALL
+    SELECT * FROM (
+        SELECT dimension, value, cases FROM health_messages_totals
+        WHERE dimension = 'disease' ORDER BY cases DESC
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT dimension, value, cases FROM health_messages_totals
+        WHERE dimension = 'location' ORDER BY cases DESC LIMIT 5
+    )
+'''
+
 class EnhancedDashboardData:
     
     def __init__(self):
@@ -17,158 +33,113 @@ class EnhancedDashboardData:
     def get_accurate_dashboard_data(self):
         """Get accurate dashboard data based on real database content"""
         try:
-            conn = sqlite3.connect('rhas_messages.db')
-            cursor = conn.cursor()
-            
-            # Get basic counts
-            cursor.execute('SELECT COUNT(*) FROM health_messages')
-            total_reports = cursor.fetchone()[0]
-            
-            # Get disease distribution (accurate) - ensure all records are counted
-            cursor.execute('''
-                SELECT 
-                    CASE 
-                        WHEN predicted_disease IS NULL OR predicted_disease = '' THEN 'general_illness'
-                        ELSE predicted_disease 
-                    END as disease,
-                    COUNT(*) as count
-                FROM health_messages 
-                GROUP BY 
-                    CASE 
-                        WHEN predicted_disease IS NULL OR predicted_disease = '' THEN 'general_illness'
-                        ELSE predicted_disease 
-                    END
-                ORDER BY count DESC
-            ''')
-            disease_data = cursor.fetchall()
-            disease_stats = {disease: count for disease, count in disease_data}
-            
-            # Verify total matches
-            disease_total = sum(disease_stats.values())
-            print(f"🔍 Data verification: Total reports: {total_reports}, Disease sum: {disease_total}")
-            if disease_total != total_reports:
-                print(f"⚠️ Mismatch detected! Adjusting general_illness count...")
-                if 'general_illness' in disease_stats:
-                    disease_stats['general_illness'] += (total_reports - disease_total)
-                else:
-                    disease_stats['general_illness'] = (total_reports - disease_total)
-            
-            # Create 4-day demo distribution for judges
-            time_series = self.create_four_day_demo_distribution(total_reports)
-            
-            # Also get real time series data for comparison
-            cursor.execute('''
-                SELECT 
-                    DATE(processed_at) as date, 
-                    COUNT(*) as count 
-                FROM health_messages 
-                WHERE processed_at >= datetime('now', '-4 days')
-                GROUP BY DATE(processed_at) 
-                ORDER BY date ASC
-            ''')
-            real_time_data = cursor.fetchall()
-            
-            # Use real data if available, otherwise use demo distribution
-            if len(real_time_data) >= 2:  # If we have real data spread across days
-                print(f"🔄 Using real time series data: {len(real_time_data)} data points")
-                real_time_series = {}
-                end_date = datetime.now().date()
-                for i in range(4):
-                    date = end_date - timedelta(days=3-i)
-                    real_time_series[date.strftime('%m-%d')] = 0
+            with read_connection() as conn:
+                cursor = conn.cursor()
+            
+                # Headline metrics from the maintained counters, an index range and the hourly roll-up
+                cursor.execute('''
+                    SELECT 
+                        (SELECT cases FROM health_messages_totals WHERE dimension = 'total' AND value = 'messages'),
+                        (SELECT cases FROM health_messages_totals WHERE dimension = 'total' AND value = 'senders'),
+                        (SELECT COUNT(*) FROM health_messages WHERE processed_at >= datetime('now', '-24 hours')),
+                        (SELECT SUM(confidence_sum) / SUM(cases) FROM health_messages_hourly)
+                ''')
+                total_reports, unique_users, reports_24h, avg_confidence = cursor.fetchone()
+                avg_confidence = avg_confidence or 0.85
+            
+                # Every breakdown in one round-trip, rows tagged with the dict they belong to
+                breakdowns = {kind: {} for kind in ('channel', 'severity', 'disease', 'location')}
+                for kind, key, count in cursor.execute(BREAKDOWNS_SQL):
+                    breakdowns[kind][key] = count
+                channel_stats = breakdowns['channel']
+                severity_stats = breakdowns['severity']
+                disease_stats = breakdowns['disease']
+                location_stats = breakdowns['location']
+            
+                # Verify total matches
+                disease_total = sum(disease_stats.values())
+                print(f"🔍 Data verification: Total reports: {total_reports}, Disease sum: {disease_total}")
+                if disease_total != total_reports:
+                    print(f"⚠️ Mismatch detected! Adjusting general_illness count...")
+                    if 'general_illness' in disease_stats:
+                        disease_stats['general_illness'] += (total_reports - disease_total)
+                    else:
+                        disease_stats['general_illness'] = (total_reports - disease_total)
+            
+                # Create 4-day demo distribution for judges
+                time_series = self.create_four_day_demo_distribution(total_reports)
+            
+                # Also get real time series data for comparison
+                cursor.execute('''
+                    SELECT 
+                        DATE(bucket_ts) as date, 
+                        SUM(cases) as count 
+                    FROM health_messages_hourly 
+                    WHERE bucket_ts >= strftime('%Y-%m-%d %H:00:00', 'now', '-4 days')
+                    GROUP BY DATE(bucket_ts) 
+                    ORDER BY date ASC
+                ''')
+                real_time_data = cursor.fetchall()
+            
+                # Use real data if available, otherwise use demo distribution
+                if len(real_time_data) >= 2:  # If we have real data spread across days
+                    print(f"🔄 Using real time series data: {len(real_time_data)} data points")
+                    real_time_series = {}
+                    end_date = datetime.now().date()
+                    for i in range(4):
+                        date = end_date - timedelta(days=3-i)
+                        real_time_series[date.strftime('%m-%d')] = 0
                 
-                for date_str, count in real_time_data:
-                    try:
-                        date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        real_time_series[date.strftime('%m-%d')] = count
-                    except:
-                        pass
+                    for date_str, count in real_time_data:
+                        try:
+                            date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                            real_time_series[date.strftime('%m-%d')] = count
+                        except:
+                            pass
                 
-                # If real data totals match our expected total, use it
-                real_total = sum(real_time_series.values())
-                if real_total > 0:
-                    time_series = real_time_series
-                    print(f"✅ Using real data: {real_total} reports over 4 days")
-            
-            print(f"📈 Final time series: {time_series} (Total: {sum(time_series.values())})")
-            
-            # Get severity distribution
-            cursor.execute('''
-                SELECT 
-                    COALESCE(severity_level, 'Medium') as severity, 
-                    COUNT(*) as count 
-                FROM health_messages 
-                GROUP BY severity_level
-            ''')
-            severity_data = cursor.fetchall()
-            severity_stats = {severity: count for severity, count in severity_data}
-            
-            # Get location distribution
-            cursor.execute('''
-                SELECT 
-                    COALESCE(location_city, 'Unknown') as location, 
-                    COUNT(*) as count 
-                FROM health_messages 
-                WHERE location_city IS NOT NULL
-                GROUP BY location_city 
-                ORDER BY count DESC
-                LIMIT 5
-            ''')
-            location_data = cursor.fetchall()
-            location_stats = {location: count for location, count in location_data}
-            
-            # Get recent reports with detailed info
-            cursor.execute('''
-                SELECT 
-                    phone_number, 
-                    message_body, 
-                    predicted_disease, 
-                    symptoms, 
-                    disease_confidence, 
-                    location_city, 
-                    severity_level, 
-                    processed_at,
-                    points_earned,
-                    tier,
-                    channel
-                FROM health_messages 
-                ORDER BY processed_at DESC 
-                LIMIT 20
-            ''')
-            
-            recent_reports = []
-            for row in cursor.fetchall():
-                try:
-                    processed_time = datetime.fromisoformat(row[7].replace('Z', '+00:00')) if row[7] else datetime.now()
-                except:
-                    processed_time = datetime.now()
+                    # If real data totals match our expected total, use it
+                    real_total = sum(real_time_series.values())
+                    if real_total > 0:
+                        time_series = real_time_series
+                        print(f"✅ Using real data: {real_total} reports over 4 days")
+            
+                print(f"📈 Final time series: {time_series} (Total: {sum(time_series.values())})")
+            
+                # Get recent reports with detailed info
+                cursor.execute('''
+                    SELECT 
+                        phone_number, 
+                        predicted_disease, 
+                        symptoms, 
+                        disease_confidence, 
+                        location_city, 
+                        severity_level, 
+                        processed_at,
+                        points_earned,
+                        tier,
+                        channel
+                    FROM health_messages 
+                    ORDER BY processed_at DESC 
+                    LIMIT 20
+                ''')
+            
+                recent_reports = []
+                for row in cursor.fetchall():
+                    processed_time = parse_timestamp(row[6]) or datetime.now()
                 
-                report = {
-                    'phone_number': row[0],
-                    'message_body': row[1],
-                    'predicted_disease': row[2] or 'general_illness',
-                    'symptoms': row[3].split(',') if row[3] else ['General symptoms'],
-                    'confidence': row[4] or 0.8,
-                    'location': row[5] or 'Unknown',
-                    'severity': row[6] or 'Medium',
-                    'created_at': processed_time,
-                    'points_earned': row[8] or 10,
-                    'tier': row[9] or 'Bronze',
-                    'channel': row[10] or 'SMS'
-                }
-                recent_reports.append(report)
-            
-            # Calculate additional metrics
-            cursor.execute('SELECT COUNT(DISTINCT phone_number) FROM health_messages')
-            unique_users = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM health_messages WHERE processed_at >= datetime("now", "-24 hours")')
-            reports_24h = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT AVG(disease_confidence) FROM health_messages WHERE disease_confidence IS NOT NULL')
-            avg_confidence = cursor.fetchone()[0] or 0.85
-            
-            conn.close()
+                    report = {
+                        'phone_number': row[0],
+                        'predicted_disease': row[1] or 'general_illness',
+                        'symptoms': decode_symptoms(row[2]) or ['General symptoms'],
+                        'confidence': row[3] or 0.8,
+                        'location': row[4] or 'Unknown',
+                        'severity': row[5] or 'Medium',
+                        'created_at': processed_time,
+                        'points_earned': row[7] or 10,
+                        'tier': row[8] or 'Bronze',
+                        'channel': row[9] or 'SMS'
+                    }
+                    recent_reports.append(report)
             
             # Prepare comprehensive dashboard data
             dashboard_data = {
@@ -178,6 +149,7 @@ class EnhancedDashboardData:
                 'avg_confidence': round(avg_confidence * 100, 1),
                 'disease_stats': disease_stats,
                 'time_series': time_series,
+                'channel_stats': channel_stats,
                 'severity_stats': severity_stats,
                 'location_stats': location_stats,
                 'recent_reports': recent_reports,
@@ -259,6 +231,9 @@ class EnhancedDashboardData:
                 '09-05': 0, '09-06': 0, '09-07': 0, '09-08': 0,
                 '09-09': 0, '09-11': 127, '09-12': 16
             },
+            'channel_stats': {
+                'SMS': 135, 'WhatsApp': 8
+            },
             'severity_stats': {
                 'High': 25, 'Medium': 98, 'Low': 20
             },
@@ -283,33 +258,31 @@ class EnhancedDashboardData:
     def get_hourly_report_frequency(self):
         """Get hourly frequency data for live line chart"""
         try:
-            conn = sqlite3.connect('rhas_messages.db')
-            cursor = conn.cursor()
-            
-            # Get reports by hour for the last 24 hours
-            cursor.execute('''
-                SELECT 
-                    strftime('%H', processed_at) as hour,
-                    COUNT(*) as count
-                FROM health_messages 
-                WHERE processed_at >= datetime('now', '-24 hours')
-                GROUP BY strftime('%H', processed_at)
-                ORDER BY hour
-            ''')
-            
-            hourly_data = cursor.fetchall()
-            
-            # Create 24-hour frequency data
-            frequency_data = {}
-            for hour in range(24):
-                hour_str = f"{hour:02d}:00"
-                frequency_data[hour_str] = 0
-            
-            for hour_str, count in hourly_data:
-                hour_formatted = f"{int(hour_str):02d}:00"
-                frequency_data[hour_formatted] = count
-            
-            conn.close()
+            with read_connection() as conn:
+                cursor = conn.cursor()
+            
+                # Get reports by hour for the last 24 hours
+                cursor.execute('''
+                    SELECT 
+                        strftime('%H', bucket_ts) as hour,
+                        SUM(cases) as count
+                    FROM health_messages_hourly 
+                    WHERE bucket_ts >= strftime('%Y-%m-%d %H:00:00', 'now', '-24 hours')
+                    GROUP BY strftime('%H', bucket_ts)
+                    ORDER BY hour
+                ''')
+            
+                hourly_data = cursor.fetchall()
+            
+                # Create 24-hour frequency data
+                frequency_data = {}
+                for hour in range(24):
+                    hour_str = f"{hour:02d}:00"
+                    frequency_data[hour_str] = 0
+            
+                for hour_str, count in hourly_data:
+                    hour_formatted = f"{int(hour_str):02d}:00"
+                    frequency_data[hour_formatted] = count
             
             return frequency_data
             
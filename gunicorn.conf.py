@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+🦄 RHAS Gunicorn Settings
+Read automatically by `gunicorn app:app` (see Procfile) and by `python app.py`
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '4003')}"
+
+# Request handlers mostly wait on SQLite and the Twilio API, so each worker serves several at once
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Dashboard caches, /api/result message results and the batched database writer are per process;
+# raise WEB_CONCURRENCY only where that is acceptable
+workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+
+# Webhooks answer Twilio immediately, so anything slower than this is stuck
+timeout = 30
+graceful_timeout = 10
+keepalive = 5
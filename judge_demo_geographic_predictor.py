@@ -4,7 +4,7 @@
 Real-time demonstration of RHAS v2.0's advanced geographic and climate analysis capabilities
 """
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, render_template, jsonify, request
 from geographic_outbreak_predictor import geographic_predictor
 import json
 from datetime import datetime
@@ -559,14 +559,15 @@ def create_judge_demo_template():
     '''
 
 # Create the judge demonstration app route
-def create_judge_demo_route(app):
+def create_judge_demo_route(app, compile_page):
     """Add judge demonstration routes to existing Flask app"""
     
+    judge_demo_page = compile_page('inline/judge_demo.html', create_judge_demo_template())
+    
     @app.route('/judge-demo')
     def judge_demo():
         """Judge demonstration page for geographic outbreak prediction"""
-        template = create_judge_demo_template()
-        return render_template_string(template, scenarios=JUDGE_DEMO_SCENARIOS)
+        return render_template(judge_demo_page, scenarios=JUDGE_DEMO_SCENARIOS)
     
     @app.route('/judge-demo/predict', methods=['POST'])
     def judge_predict():
@@ -4,7 +4,7 @@
 Generates personalized medical histories and patient details for each health report
 """
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, render_template, jsonify, request
 import sqlite3
 import json
 from datetime import datetime, timedelta
@@ -744,9 +744,10 @@ def create_patient_report_template():
 </html>
     '''
 
-def create_patient_report_routes(app):
+def create_patient_report_routes(app, compile_page):
     """Add patient medical report routes to existing Flask app"""
     patient_system = PatientMedicalHistorySystem()
+    patient_report_page = compile_page('inline/patient_report.html', create_patient_report_template())
     
     @app.route('/patient-report/<phone_number>')
     def patient_medical_report(phone_number):
@@ -756,8 +757,7 @@ def create_patient_report_routes(app):
         if not patient_data:
             return "Patient report not found", 404
         
-        template = create_patient_report_template()
-        return render_template_string(template, patient=patient_data, datetime=datetime)
+        return render_template(patient_report_page, patient=patient_data, datetime=datetime)
     
     @app.route('/api/patient-data/<phone_number>')
     def api_patient_data(phone_number):
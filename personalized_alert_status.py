@@ -4,7 +4,7 @@
 Creates detailed status pages for each government alert with personalized action plans
 """
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, render_template, jsonify, request
 import sqlite3
 import json
 from datetime import datetime, timedelta
@@ -818,9 +818,10 @@ def create_personalized_alert_template():
 </html>
     '''
 
-def create_personalized_alert_routes(app):
+def create_personalized_alert_routes(app, compile_page):
     """Add personalized alert routes to existing Flask app"""
     status_system = PersonalizedAlertStatusSystem()
+    alert_status_page = compile_page('inline/alert_status.html', create_personalized_alert_template())
     
     @app.route('/alert-status/<alert_id>')
     def personalized_alert_status(alert_id):
@@ -830,8 +831,7 @@ def create_personalized_alert_routes(app):
         if not alert_details:
             return "Alert not found", 404
         
-        template = create_personalized_alert_template()
-        return render_template_string(template, alert=alert_details)
+        return render_template(alert_status_page, alert=alert_details)
     
     @app.route('/api/alert-details/<alert_id>')
     def api_alert_details(alert_id):
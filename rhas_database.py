@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+💾 RHAS Message Database Connections
+Shared SQLite connections for rhas_messages.db - one serialized writer plus a small reader pool
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = 'rhas_messages.db'
+READ_POOL_SIZE = 5
+# Per-connection prepared statement cache (sqlite3's default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Queued writes are committed together once this many rows or this much time has accumulated
+WRITE_BATCH_MAX_ROWS = 256
+WRITE_BATCH_INTERVAL = 0.1
+# Upper bound on queued rows; past this queue_write raises queue.Full instead of growing memory
+WRITE_QUEUE_MAX_ROWS = 10000
+# A batch that still finds the database busy or locked after busy_timeout is retried this many
+# times, backing off this many seconds more each time, before it falls back to one row at a time
+WRITE_BATCH_RETRIES = 5
+WRITE_BATCH_RETRY_DELAY = 0.5
+
+# Applied to every connection we hand out (WAL itself is persistent per database file)
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA busy_timeout=5000',
+)
+
+_write_lock = threading.Lock()
+_write_conn = None
+_read_pool = queue.Queue(maxsize=READ_POOL_SIZE)
+
+# Webhook threads only push rows here; a single writer thread batches them into transactions
+_pending_writes = queue.Queue(maxsize=WRITE_QUEUE_MAX_ROWS)
+_writer_thread = None
+_writer_start_lock = threading.Lock()
+_STOP_WRITER = object()
+# Called with no arguments after the writer thread commits rows, e.g. to drop caches built from older data
+_commit_hooks = []
+
+
+def configure_connection(conn):
+    """Apply the RHAS performance PRAGMAs to a connection"""
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def encode_symptoms(symptom_names):
+    """Store symptom names as a compact comma-separated string"""
+    return ','.join(symptom_names)
+
+
+@lru_cache(maxsize=512)
+def decode_symptoms(value):
+    """
+    Read a symptoms column value, accepting both CSV and the older JSON list format.
+    Cached because dashboard refreshes keep decoding the same recent rows, so the
+    result is a tuple that callers can't mutate.
+    """
+    if not value:
+        return ()
+    if value.startswith('['):
+        return tuple(_json_loads(value))
+    return tuple(value.split(','))
+
+
+@lru_cache(maxsize=1024)
+def parse_timestamp(value):
+    """
+    Parse a stored timestamp ('YYYY-MM-DD HH:MM:SS' or ISO 8601), or None if it is empty or invalid.
+    Cached since the dashboard re-reads the same recent rows on every refresh.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _open_read_connection():
+    conn = configure_connection(sqlite3.connect(DB_PATH, check_same_thread=False,
+                                                 cached_statements=STATEMENT_CACHE_SIZE))
+    conn.execute('PRAGMA query_only=1')
+    return conn
+
+
+@contextmanager
+def write_connection():
+    """
+    Yield the shared autocommit writer connection while holding the write lock.
+    SQLite allows a single writer, so writes are serialized here instead of
+    inside SQLite's own busy handler.
+    """
+    global _write_conn
+    with _write_lock:
+        if _write_conn is None:
+            _write_conn = configure_connection(
+                sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                                cached_statements=STATEMENT_CACHE_SIZE)
+            )
+        yield _write_conn
+
+
+@contextmanager
+def read_connection():
+    """Borrow a read-only connection from the pool, opening one if the pool is empty"""
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_read_connection()
+    try:
+        yield conn
+    finally:
+        try:
+            _read_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+def _is_busy_error(error):
+    """True for the 'database is locked' / 'database is busy' errors another process's writer causes"""
+    message = str(error).lower()
+    return isinstance(error, sqlite3.OperationalError) and ('locked' in message or 'busy' in message)
+
+
+def _run_in_transaction(conn, grouped):
+    """Execute grouped {sql: [params, ...]} in one transaction, rolling back on any error"""
+    try:
+        # Take the write lock up front so another process's writer can't make us fail mid-batch
+        conn.execute('BEGIN IMMEDIATE')
+        for sql, rows in grouped.items():
+            conn.executemany(sql, rows)
+        conn.execute('COMMIT')
+    except Exception:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+
+
+def _commit_batch(batch):
+    """
+    Write a batch of (sql, params) pairs in one transaction, one executemany per statement.
+    Busy/locked errors retry the whole batch; any other failure replays it row by row so only
+    the rows that fail on their own are dropped.
+    """
+    grouped = {}
+    for sql, params in batch:
+        grouped.setdefault(sql, []).append(params)
+    
+    with write_connection() as conn:
+        dropped = None
+        for attempt in range(WRITE_BATCH_RETRIES + 1):
+            try:
+                _run_in_transaction(conn, grouped)
+                dropped = 0
+                break
+            except Exception as e:
+                if not _is_busy_error(e) or attempt == WRITE_BATCH_RETRIES:
+                    logger.warning("Background batch of %d rows failed (%s), writing rows one at a time", len(batch), e)
+                    break
+                logger.warning("Database busy, retrying batch of %d rows: %s", len(batch), e)
+            time.sleep(WRITE_BATCH_RETRY_DELAY * (attempt + 1))
+        
+        if dropped is None:
+            dropped = 0
+            for sql, params in batch:
+                try:
+                    _run_in_transaction(conn, {sql: [params]})
+                except Exception as e:
+                    dropped += 1
+                    logger.error("Background database write failed, row dropped: %s", e)
+            if dropped:
+                logger.error("Background database write dropped %d of %d rows", dropped, len(batch))
+    
+    if dropped < len(batch):
+        _run_commit_hooks()
+
+
+def add_commit_hook(callback):
+    """Register a callback to run after each background batch commits (from the writer thread)"""
+    _commit_hooks.append(callback)
+
+
+def _run_commit_hooks():
+    for callback in _commit_hooks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error("Database commit hook %s failed: %s", getattr(callback, '__name__', callback), e)
+
+
+def _writer_loop():
+    while True:
+        item = _pending_writes.get()
+        if item is _STOP_WRITER:
+            return
+        
+        batch = [item]
+        deadline = time.monotonic() + WRITE_BATCH_INTERVAL
+        stop = False
+        while len(batch) < WRITE_BATCH_MAX_ROWS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _pending_writes.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP_WRITER:
+                stop = True
+                break
+            batch.append(item)
+        
+        _commit_batch(batch)
+        if stop:
+            return
+
+
+def _stop_writer():
+    """Flush anything still queued before the process exits"""
+    if _writer_thread is not None and _writer_thread.is_alive():
+        _pending_writes.put(_STOP_WRITER)
+        _writer_thread.join(timeout=5)
+
+
+def queue_write(sql, params):
+    """
+    Queue a write statement for the background writer thread and return immediately.
+    Raises queue.Full if WRITE_QUEUE_MAX_ROWS writes are already waiting.
+    """
+    global _writer_thread
+    if _writer_thread is None:
+        with _writer_start_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(target=_writer_loop, name='rhas-db-writer', daemon=True)
+                _writer_thread.start()
+                atexit.register(_stop_writer)
+    _pending_writes.put_nowait((sql, params))
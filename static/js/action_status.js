@@ -0,0 +1,35 @@
+// RHAS v2.0 detailed action status page: expandable sections and change-driven refresh
+// Page data rendered by the server as a JSON island
+const statusConfig = JSON.parse(document.getElementById('action-status-config').textContent);
+
+function toggleSection(sectionId) {
+    const section = document.getElementById(sectionId);
+    section.classList.toggle('show');
+}
+
+// Check the data version instead of reloading on a timer. Only visible tabs check, a tab
+// coming back into view checks straight away if it is due, and the page only reloads when
+// the data changed and no section is expanded.
+let lastCheck = Date.now();
+async function checkActionStatusVersion() {
+    if (document.visibilityState !== 'visible' || Date.now() - lastCheck < statusConfig.refresh_ms) return;
+    lastCheck = Date.now();
+    try {
+        const response = await fetch('/api/detailed-action-status/version', {credentials: 'same-origin'});
+        if (response.status === 401) {
+            window.location.reload();
+            return;
+        }
+        if (!response.ok) return;
+        const {version} = await response.json();
+        if (version !== statusConfig.version && !document.querySelector('.collapsible.show')) {
+            window.location.reload();
+        }
+    } catch (err) {
+        console.warn('Action status refresh failed', err);
+    }
+}
+document.addEventListener('visibilitychange', checkActionStatusVersion);
+setInterval(checkActionStatusVersion, 5000);
+
+console.log('🏥 Detailed Action Status Dashboard Loaded');
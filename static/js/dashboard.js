@@ -0,0 +1,228 @@
+// RHAS v2.0 dashboard: charts, report dropdowns and live metric refresh
+// Page data rendered by the server as JSON islands
+const dashboardConfig = JSON.parse(document.getElementById('dashboard-config').textContent);
+let chartData = JSON.parse(document.getElementById('chart-data').textContent);
+// Charts are built when their canvas first scrolls into view, from the latest chartData
+let timelineChart = null;
+let diseaseChart = null;
+
+// Timeline Chart
+function makeTimelineChart(canvas) {
+    timelineChart = new Chart(canvas.getContext('2d'), {
+        type: 'line',
+        data: {
+            labels: chartData.timeline_labels,
+            datasets: [{
+                label: 'Reports',
+                data: chartData.timeline_counts,
+                borderColor: '#667eea',
+                backgroundColor: 'rgba(102, 126, 234, 0.1)',
+                tension: 0.4,
+                fill: true
+            }]
+        },
+        options: {
+            responsive: true,
+            plugins: { legend: { display: false } },
+            scales: {
+                y: { beginAtZero: true, grid: { display: false } },
+                x: { grid: { display: false } }
+            }
+        }
+    });
+}
+
+// Disease Distribution Chart
+function makeDiseaseChart(canvas) {
+    diseaseChart = new Chart(canvas.getContext('2d'), {
+        type: 'doughnut',
+        data: {
+            labels: chartData.disease_labels,
+            datasets: [{
+                data: chartData.disease_counts,
+                backgroundColor: ['#667eea', '#764ba2', '#f093fb', '#f5576c', '#4facfe']
+            }]
+        },
+        options: {
+            responsive: true,
+            plugins: {
+                legend: { position: 'bottom', labels: { fontSize: 12 } }
+            }
+        }
+    });
+}
+
+const chartBuilders = {timelineChart: makeTimelineChart, diseaseChart: makeDiseaseChart};
+const chartObserver = new IntersectionObserver((entries, observer) => {
+    entries.forEach(entry => {
+        if (entry.isIntersecting) {
+            observer.unobserve(entry.target);
+            chartBuilders[entry.target.id](entry.target);
+        }
+    });
+}, {rootMargin: '200px'});
+// The canvases (and Chart.js itself) are left out of the page when there is nothing to plot
+const pageHasCharts = Object.keys(chartBuilders).some(id => document.getElementById(id));
+Object.keys(chartBuilders).forEach(id => {
+    const canvas = document.getElementById(id);
+    if (canvas) chartObserver.observe(canvas);
+});
+
+// Dropdown Functionality
+function toggleDropdown(dropdownId) {
+    // Close all other dropdowns first
+    const allDropdowns = document.querySelectorAll('.dropdown-content');
+    allDropdowns.forEach(dropdown => {
+        if (dropdown.id !== dropdownId) {
+            dropdown.classList.remove('show');
+        }
+    });
+
+    // Toggle the clicked dropdown
+    const dropdown = document.getElementById(dropdownId);
+    if (dropdown) {
+        if (dropdown.childElementCount === 0) {
+            const template = document.getElementById('tpl-' + dropdownId);
+            if (template) {
+                dropdown.appendChild(template.content.cloneNode(true));
+            } else if ('reportUrl' in dropdown.dataset) {
+                renderReportDropdown(dropdown);
+            }
+        }
+        dropdown.classList.toggle('show');
+    }
+}
+
+function escapeHtml(value) {
+    return String(value).replace(/[&<>"']/g, ch => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+    })[ch]);
+}
+
+// Report dropdowns ship empty and are built from their data- attributes on first open
+function renderReportDropdown(dropdown) {
+    const {reportUrl, disease, diseaseLabel, alertLevel, location, actionStatus, progress, stage} = dropdown.dataset;
+    dropdown.innerHTML = `
+        <div class="dropdown-header">🏛️ Government Alert Details</div>
+        <div class="dropdown-item"><strong>Disease:</strong> ${escapeHtml(diseaseLabel)}</div>
+        <div class="dropdown-item"><strong>Alert Level:</strong> ${escapeHtml(alertLevel)}</div>
+        <div class="dropdown-item"><strong>Location:</strong> 📍 ${escapeHtml(location)}</div>
+        <div class="dropdown-item"><strong>Action Status:</strong> ${escapeHtml(actionStatus)}</div>
+        <div class="dropdown-item">
+            <strong>Progress:</strong>
+            <div class="progress-bar"><div class="progress-fill" style="width: ${Number(progress)}%"></div></div>
+            <small>${escapeHtml(stage)}</small>
+        </div>
+        <div class="dropdown-actions">
+            <a class="btn-small btn-primary" href="${escapeHtml(reportUrl)}">📄 Full Report</a>
+            <button class="btn-small btn-secondary" data-action="updateProgress" data-arg="${escapeHtml(disease)}">🔄 Update</button>
+        </div>`;
+}
+
+// One delegated listener for every dropdown toggle and dropdown action button
+const DROPDOWN_ACTIONS = {
+    updateProgress, viewOutbreakMap, downloadOutbreakReport, updateOutbreakStatus
+};
+document.addEventListener('click', function(event) {
+    const toggle = event.target.closest('[data-dropdown]');
+    if (toggle) {
+        toggleDropdown(toggle.dataset.dropdown);
+        return;
+    }
+    const action = event.target.closest('[data-action]');
+    if (action && DROPDOWN_ACTIONS.hasOwnProperty(action.dataset.action)) {
+        DROPDOWN_ACTIONS[action.dataset.action](action.dataset.arg);
+    }
+    // Any other click closes open dropdowns
+    document.querySelectorAll('.dropdown-content.show').forEach(dropdown => {
+        dropdown.classList.remove('show');
+    });
+});
+
+// Individual Report Actions
+function viewFullAlert(disease) {
+    // Navigate to detailed government alert page
+    console.log(`Viewing full alert for: ${disease}`);
+    window.location.href = '/detailed-action-status';
+}
+
+function updateProgress(disease) {
+    alert(`🔄 Updating progress for ${disease.replace('_', ' ').toUpperCase()}...\n\n• Status: Updated to latest information\n• Timeline: Refreshed\n• Actions: Synchronized with field teams\n• Notifications: Sent to relevant departments`);
+    console.log(`Updating progress for: ${disease}`);
+}
+
+// Outbreak Management Actions
+function viewOutbreakMap(disease) {
+    alert(`🗺️ Opening live outbreak map for ${disease.toUpperCase()}...\n\n• Real-time case locations\n• Hotspot identification\n• Resource deployment tracking\n• Geographic risk assessment\n• Live hospital capacity data`);
+    console.log(`Viewing outbreak map for: ${disease}`);
+}
+
+function downloadOutbreakReport(disease) {
+    // Navigate to detailed government alert report page
+    console.log(`Downloading outbreak report for: ${disease}`);
+    window.location.href = '/detailed-action-status';
+}
+
+function updateOutbreakStatus(disease) {
+    alert(`🔄 Updating outbreak status for ${disease.toUpperCase()}...\n\n• Live data synchronized\n• Response teams updated\n• Status escalation reviewed\n• Stakeholder notifications sent\n• Dashboard metrics refreshed`);
+    console.log(`Updating outbreak status for: ${disease}`);
+}
+
+// Auto-refresh progress bars (simulate live updates). The collection is live, so bars
+// added when a dropdown is first opened are picked up without re-querying the DOM.
+const progressBars = document.getElementsByClassName('progress-fill');
+setInterval(function() {
+    if (document.hidden || progressBars.length === 0) return;
+    requestAnimationFrame(() => {
+        for (const bar of progressBars) {
+            const outbreak = bar.classList.contains('outbreak-progress');
+            // Outbreak progress updates more frequently
+            const currentWidth = parseInt(bar.style.width) || (outbreak ? 70 : 30);
+            const newWidth = Math.min(outbreak ? 95 : 90, currentWidth + Math.random() * (outbreak ? 3 : 2));
+            bar.style.width = newWidth + '%';
+        }
+    });
+}, 30000); // Update every 30 seconds
+
+// Live refresh: poll the metrics JSON and patch text nodes and charts in place.
+// Only a new report (which changes the recent reports list), or the first data for
+// a page rendered without charts, reloads the page, and not while an actions dropdown is open.
+let shownTotalReports = dashboardConfig.total_reports;
+async function refreshDashboardMetrics() {
+    if (document.hidden) return;
+    try {
+        const response = await fetch('/api/dashboard-metrics', {credentials: 'same-origin'});
+        if (response.status === 401) {
+            window.location.reload();
+            return;
+        }
+        if (!response.ok) return;
+        const metrics = await response.json();
+
+        const chartsArrived = !pageHasCharts && (metrics.timeline_counts.length > 0 || metrics.disease_counts.length > 0);
+        if ((metrics.total_reports !== shownTotalReports || chartsArrived) && !document.querySelector('.dropdown-content.show')) {
+            window.location.reload();
+            return;
+        }
+        document.querySelectorAll('[data-metric]').forEach(el => {
+            const value = String(metrics[el.dataset.metric]);
+            if (el.textContent !== value) el.textContent = value;
+        });
+        chartData = metrics;
+        if (timelineChart) {
+            timelineChart.data.labels = metrics.timeline_labels;
+            timelineChart.data.datasets[0].data = metrics.timeline_counts;
+            timelineChart.update('none');
+        }
+        if (diseaseChart) {
+            diseaseChart.data.labels = metrics.disease_labels;
+            diseaseChart.data.datasets[0].data = metrics.disease_counts;
+            diseaseChart.update('none');
+        }
+    } catch (err) {
+        console.warn('Dashboard refresh failed', err);
+    }
+}
+setInterval(refreshDashboardMetrics, dashboardConfig.refresh_ms);
+
+console.log('🏥 RHAS v2.0 Enhanced Dashboard Loaded - Dropdown functionality active');
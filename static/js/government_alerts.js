@@ -0,0 +1,36 @@
+// RHAS v2.0 government alerts page: live alert counters
+// Page data rendered by the server as a JSON island
+const alertsConfig = JSON.parse(document.getElementById('alerts-config').textContent);
+
+// Poll the alert counters and patch them in place. Only a raised or closed alert
+// (which changes the alert list) reloads the page.
+let shownAlertIds = Object.keys(alertsConfig.alert_cases).sort().join();
+async function refreshAlertMetrics() {
+    if (document.hidden) return;
+    try {
+        const response = await fetch('/api/government-alerts/metrics', {credentials: 'same-origin'});
+        if (response.status === 401) {
+            window.location.reload();
+            return;
+        }
+        if (!response.ok) return;
+        const metrics = await response.json();
+
+        if (Object.keys(metrics.alert_cases).sort().join() !== shownAlertIds) {
+            window.location.reload();
+            return;
+        }
+        document.querySelectorAll('[data-metric]').forEach(el => {
+            const value = String(metrics[el.dataset.metric]);
+            if (el.textContent !== value) el.textContent = value;
+        });
+        document.querySelectorAll('[data-alert-id]').forEach(item => {
+            const cases = item.querySelector('[data-alert-cases]');
+            const value = String(metrics.alert_cases[item.dataset.alertId]);
+            if (cases && cases.textContent !== value) cases.textContent = value;
+        });
+    } catch (err) {
+        console.warn('Alert refresh failed', err);
+    }
+}
+setInterval(refreshAlertMetrics, alertsConfig.refresh_ms);